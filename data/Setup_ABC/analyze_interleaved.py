@@ -0,0 +1,134 @@
+import os
+import sys
+import math
+import json
+import numpy as np
+from datetime import datetime
+
+# QTORSION_FAKE_RUNTIME=1 (with src/ on PYTHONPATH) runs against src/fake_runtime.py
+if os.environ.get("QTORSION_FAKE_RUNTIME"):
+    from fake_runtime import FakeRuntimeService as QiskitRuntimeService
+else:
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
+def timestamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def timestamp_for_filename():
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+def get_segment_counts(job_id, num_pubs):
+    """Returns (zeros, shots) arrays with one entry per pub of the interleaved job."""
+    print("[" + timestamp() + "] Getting job " + job_id)
+    service = QiskitRuntimeService()
+    job = service.job(job_id)
+
+    if job.status() != "DONE":
+        print("[" + timestamp() + "] Job is not DONE.")
+        return None
+
+    result = job.result()
+    zeros = np.empty(num_pubs, dtype=np.int64)
+    shots = np.empty(num_pubs, dtype=np.int64)
+    for i in range(num_pubs):
+        arr = result[i].data.c._array
+        shots[i] = arr.shape[0]
+        zeros[i] = np.count_nonzero(arr[:, 0] == 0)
+    return zeros, shots
+
+def paired_z(p_x, p_y):
+    """Drift-corrected z from per-block differences: segments of x and y that ran
+    next to each other share the same slow drift, which cancels in p_x - p_y."""
+    d = p_x - p_y
+    n = len(d)
+    delta = abs(d.mean())
+    sigma = d.std(ddof=1) / math.sqrt(n) if n > 1 else 0.0
+    z = delta / sigma if sigma > 0 else float("inf")
+    return delta, sigma, z
+
+def pooled_z(zeros_x, shots_x, zeros_y, shots_y):
+    """Binomial z of the pooled counts, as in analyze_all.py (ignores drift)."""
+    p_x, p_y = zeros_x / shots_x, zeros_y / shots_y
+    sigma = math.sqrt(p_x * (1 - p_x) / shots_x + p_y * (1 - p_y) / shots_y)
+    return abs(p_x - p_y) / sigma if sigma > 0 else float("inf")
+
+def analyze(meta_path):
+    with open(meta_path, "r") as f:
+        meta = json.load(f)
+
+    labels = [v["label"] for v in meta["variants"]]
+    schedule = meta["schedule"]
+    segments = meta["segments"]
+
+    data = get_segment_counts(meta["job_id"], len(schedule))
+    if data is None:
+        print(json.dumps({"error": "Job is not complete.", "job_id": meta["job_id"]}, indent=2))
+        return
+    zeros, shots = data
+
+    # Per-segment p0 laid out as (block, label)
+    pub = np.array([s["pub"] for s in schedule])
+    block = np.array([s["block"] for s in schedule])
+    column = np.array([labels.index(s["label"]) for s in schedule])
+    zeros_grid = np.zeros((segments, len(labels)), dtype=np.int64)
+    shots_grid = np.zeros((segments, len(labels)), dtype=np.int64)
+    zeros_grid[block, column] = zeros[pub]
+    shots_grid[block, column] = shots[pub]
+    p0 = zeros_grid / shots_grid
+
+    a, b, c = labels.index("A"), labels.index("B"), labels.index("C")
+    delta_ab, sigma_ab, z_ab = paired_z(p0[:, a], p0[:, b])
+    delta_ac, sigma_ac, z_ac = paired_z(p0[:, a], p0[:, c])
+    z_eff = z_ab / (z_ac + 1e-9)
+
+    totals_zeros = zeros_grid.sum(axis=0)
+    totals_shots = shots_grid.sum(axis=0)
+    z_ab_pooled = pooled_z(totals_zeros[a], totals_shots[a], totals_zeros[b], totals_shots[b])
+    z_ac_pooled = pooled_z(totals_zeros[a], totals_shots[a], totals_zeros[c], totals_shots[c])
+
+    # Slope of the block-mean p0, i.e. the drift the pairing removes
+    drift = np.polyfit(np.arange(segments), p0.mean(axis=1), 1)[0] if segments > 1 else 0.0
+
+    result_json = {
+        "timestamp": timestamp(),
+        "job_id": meta["job_id"],
+        "mode": meta["mode"],
+        "order": meta["order"],
+        "segments": segments,
+        "segment_shots": meta["segment_shots"]
+    }
+    for i, label in enumerate(labels):
+        p = totals_zeros[i] / totals_shots[i]
+        result_json[f"job_{label.lower()}"] = {
+            "p_0": round(p, 5),
+            "sigma": round(math.sqrt(p * (1 - p) / totals_shots[i]), 5),
+            "shots": int(totals_shots[i]),
+            "counts": {"0": int(totals_zeros[i]), "1": int(totals_shots[i] - totals_zeros[i])},
+            "segment_p_0": [round(v, 5) for v in p0[:, i]]
+        }
+    result_json.update({
+        "delta_ab": round(delta_ab, 5),
+        "sigma_ab": round(sigma_ab, 5),
+        "delta_ac": round(delta_ac, 5),
+        "sigma_ac": round(sigma_ac, 5),
+        "z_ab": "inf" if math.isinf(z_ab) else round(z_ab, 3),
+        "z_ac": "inf" if math.isinf(z_ac) else round(z_ac, 3),
+        "z_eff": "inf" if math.isinf(z_eff) else round(z_eff, 3),
+        "z_ab_pooled": round(z_ab_pooled, 3),
+        "z_ac_pooled": round(z_ac_pooled, 3),
+        "drift_p0_per_block": float(drift)
+    })
+
+    print(json.dumps(result_json, indent=2))
+
+    # Save to file
+    filename = f"results3i_{timestamp_for_filename()}.json"
+    with open(filename, "w") as f:
+        json.dump(result_json, f, indent=2)
+    print(f"[{timestamp()}] Saved to {filename}")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python analyze_interleaved.py <submit_meta.json>")
+        sys.exit(1)
+    analyze(sys.argv[1])
@@ -1,10 +1,17 @@
+import os
 import hashlib
 import json
+import random
 import numpy as np
 from datetime import datetime
 from qiskit import QuantumCircuit, transpile
 from qiskit.qasm3 import dumps as qasm3_dumps, loads as qasm3_loads
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
+
+# QTORSION_FAKE_RUNTIME=1 (with src/ on PYTHONPATH) runs against src/fake_runtime.py
+if os.environ.get("QTORSION_FAKE_RUNTIME"):
+    from fake_runtime import FakeRuntimeService as QiskitRuntimeService, FakeSamplerV2 as SamplerV2
+else:
+    from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
 
 # Constants (configurable)
 PHI = np.pi / 4
@@ -16,6 +23,13 @@ INSTANCE = "three"
 BACKEND_NAME = "ibm_strasbourg"
 #INSTANCE = "two"
 
+# Interleaved scheduling: "blocks" submits A, B, C as separate 10,000-shot jobs;
+# "interleaved" splits each variant into SEGMENTS short segments and submits them
+# in one job, ordered "abba" (ABC CBA ABC ...) or "random" within each block
+MODE = "blocks"
+SEGMENTS = 50
+ORDER = "abba"
+
 # Helper functions
 def timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -42,8 +56,8 @@ def create_torsion_circuit(phi, theta, reverse=False):
     return qc
 
 # Experiment execution
-def run_single_experiment(label, phi, theta, reverse, backend, sampler, seed):
-    """Runs one circuit variant (A/B/C) and returns job metadata."""
+def prepare_circuit(label, phi, theta, reverse, backend, seed):
+    """Builds and transpiles one circuit variant; returns (circuit, metadata)."""
     print(f"[{timestamp()}] Preparing circuit {label}...")
     qc = create_torsion_circuit(phi, theta, reverse)
     qasm3_str = qasm3_dumps(qc)
@@ -51,18 +65,36 @@ def run_single_experiment(label, phi, theta, reverse, backend, sampler, seed):
 
     print(f"[{timestamp()}] Transpiling...")
     tqc = transpile(qasm3_loads(qasm3_str), backend=backend, seed_transpiler=seed)
-
-    print(f"[{timestamp()}] Submitting circuit {label}...")
-    job = sampler.run([tqc], shots=SHOTS)
-    return {
+    return tqc, {
         "label": label,
-        "job_id": job.job_id(),
         "reverse": reverse,
         "phi": phi,
         "theta": theta,
         "qasm3_hash": qasm3_hash
     }
 
+def run_single_experiment(label, phi, theta, reverse, backend, sampler, seed):
+    """Runs one circuit variant (A/B/C) and returns job metadata."""
+    tqc, meta = prepare_circuit(label, phi, theta, reverse, backend, seed)
+
+    print(f"[{timestamp()}] Submitting circuit {label}...")
+    job = sampler.run([tqc], shots=SHOTS)
+    return dict(meta, job_id=job.job_id())
+
+def build_schedule(labels, segments, order, seed):
+    """Returns [(block, label), ...]: every block runs each label once, in mirrored
+    order on alternate blocks ("abba") or shuffled per block ("random")."""
+    rng = random.Random(seed)
+    schedule = []
+    for block in range(segments):
+        block_labels = list(labels)
+        if order == "random":
+            rng.shuffle(block_labels)
+        elif block % 2 == 1:
+            block_labels.reverse()
+        schedule.extend((block, label) for label in block_labels)
+    return schedule
+
 def run_full_experiment():
     """Main function to run all 3 circuits (A, B, C)."""
     print(f"[{timestamp()}] Connecting to {BACKEND_NAME}...")
@@ -92,6 +124,63 @@ def run_full_experiment():
 
     return [job["job_id"] for job in results["jobs"]]
 
+def run_interleaved_experiment():
+    """Submits A, B, C as interleaved short segments in a single job and returns
+    the submit filename that analyze_interleaved.py takes."""
+    if ORDER not in ("abba", "random"):
+        raise ValueError(f"ORDER must be \"abba\" or \"random\", got {ORDER!r}.")
+    if ORDER == "abba" and SEGMENTS % 2 != 0:
+        raise ValueError(f"SEGMENTS ({SEGMENTS}) must be even for \"abba\" so every block is mirrored.")
+    if SHOTS % SEGMENTS != 0:
+        raise ValueError(f"SHOTS ({SHOTS}) must be a multiple of SEGMENTS ({SEGMENTS}).")
+
+    print(f"[{timestamp()}] Connecting to {BACKEND_NAME}...")
+    service = QiskitRuntimeService()
+    backend = service.backend(name=BACKEND_NAME, instance=INSTANCE)
+    sampler = SamplerV2(backend)
+
+    segment_shots = SHOTS // SEGMENTS
+    circuits = {}
+    variants = []
+    for label, reverse in [("A", False), ("B", True), ("C", False)]:
+        tqc, meta = prepare_circuit(label, PHI, THETA, reverse, backend, SEED)
+        circuits[label] = tqc
+        variants.append(meta)
+
+    # Fresh seed per submission so "random" order differs between runs
+    schedule_seed = random.SystemRandom().getrandbits(32)
+    schedule = build_schedule([v["label"] for v in variants], SEGMENTS, ORDER, schedule_seed)
+    pubs = [(circuits[label], None, segment_shots) for _, label in schedule]
+
+    print(f"[{timestamp()}] Submitting {len(pubs)} segments ({ORDER}, {segment_shots} shots each)...")
+    job = sampler.run(pubs)
+
+    results = {
+        "timestamp": timestamp(),
+        "backend": BACKEND_NAME,
+        "shots": SHOTS,
+        "seed_transpiler": SEED,
+        "mode": "interleaved",
+        "order": ORDER,
+        "schedule_seed": schedule_seed,
+        "segments": SEGMENTS,
+        "segment_shots": segment_shots,
+        "job_id": job.job_id(),
+        "variants": variants,
+        "schedule": [{"pub": i, "block": block, "label": label} for i, (block, label) in enumerate(schedule)]
+    }
+
+    filename = f"submit_{filename_timestamp()}.json"
+    with open(filename, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"[{timestamp()}] Saved to {filename}")
+
+    return filename
+
 if __name__ == "__main__":
-    job_ids = run_full_experiment()
-    print(" ".join(job_ids))  # For manager.py to capture
\ No newline at end of file
+    if MODE == "interleaved":
+        # Last line is the submit file for analyze_interleaved.py, not job ids
+        print(run_interleaved_experiment())
+    else:
+        job_ids = run_full_experiment()
+        print(" ".join(job_ids))  # For manager.py to capture (job ids for analyze.py <A> <B> <C>)
\ No newline at end of file
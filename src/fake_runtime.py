@@ -0,0 +1,298 @@
+import os
+import json
+import math
+import time
+import random
+import hashlib
+import threading
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+
+# Defaults (configurable per service)
+DEFAULT_SHOTS = 4096
+DEFAULT_P0 = 0.95
+QUEUE_LATENCY = 0.0
+RUN_TIME = 0.0
+FAILURE_RATE = 0.0
+TIMEOUT_RATE = 0.0
+RESULT_TIMEOUT = 60.0
+POLL_INTERVAL = 0.01
+STATE_NAME = "fake_runtime_state.jsonl"
+JOB_PREFIX = "fake"
+
+# Offline stand-in for the parts of qiskit_ibm_runtime this project uses:
+# QiskitRuntimeService().backend(...) / .job(...), SamplerV2(backend).run(...),
+# job.job_id(), job.status() and job.result()[i].data.c.
+#
+# Scripts that construct the service without arguments are configured through
+# QTORSION_FAKE_REPLAY, QTORSION_FAKE_STATE, QTORSION_FAKE_QUEUE_LATENCY,
+# QTORSION_FAKE_RUN_TIME, QTORSION_FAKE_FAILURE_RATE, QTORSION_FAKE_TIMEOUT_RATE
+# and QTORSION_FAKE_SEED.
+
+def env_value(name, default, cast=float):
+    value = os.environ.get(name)
+    return default if value in (None, "") else cast(value)
+
+class FakeJobFailureError(RuntimeError):
+    pass
+
+class FakeJobNotFoundError(KeyError):
+    pass
+
+class FakeBitArray:
+    """Minimal BitArray: one row per shot, one uint8 element per classical bit."""
+
+    def __init__(self, counts, num_bits=1):
+        self.num_bits = num_bits
+        self._counts = counts
+        self._arr = None
+
+    @property
+    def _array(self):
+        if self._arr is None:
+            keys = list(self._counts)
+            bits = np.array([[int(ch) for ch in key.zfill(self.num_bits)] for key in keys], dtype=np.uint8)
+            repeats = np.array([self._counts[key] for key in keys], dtype=np.int64)
+            self._arr = np.repeat(bits.reshape(len(keys), self.num_bits), repeats, axis=0)
+        return self._arr
+
+    @property
+    def num_shots(self):
+        return sum(self._counts.values())
+
+    def get_counts(self):
+        return dict(self._counts)
+
+class FakeJob:
+    """A job whose status is derived from the wall clock: QUEUED until its queue
+    latency has passed, RUNNING for its run time, then DONE or ERROR. Jobs picked
+    for timeout injection stay RUNNING forever."""
+
+    def __init__(self, service, job_id, pub_counts, queued_until, running_until, fate):
+        self.service = service
+        self._job_id = job_id
+        self._pub_counts = pub_counts
+        self._queued_until = queued_until
+        self._running_until = running_until
+        self._fate = fate
+
+    def to_state(self):
+        return {
+            "pub_counts": self._pub_counts,
+            "queued_until": self._queued_until,
+            "running_until": self._running_until,
+            "fate": self._fate
+        }
+
+    @classmethod
+    def from_state(cls, service, job_id, state):
+        return cls(service, job_id, state["pub_counts"], state["queued_until"], state["running_until"], state["fate"])
+
+    def job_id(self):
+        return self._job_id
+
+    def status(self):
+        now = time.time()
+        if now < self._queued_until:
+            return "QUEUED"
+        if now < self._running_until or self._fate == "TIMEOUT":
+            return "RUNNING"
+        return self._fate
+
+    def done(self):
+        return self.status() == "DONE"
+
+    def result(self, timeout=None):
+        timeout = self.service.result_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+        while True:
+            status = self.status()
+            if status == "DONE":
+                return [SimpleNamespace(data=SimpleNamespace(c=FakeBitArray(counts))) for counts in self._pub_counts]
+            if status == "ERROR":
+                raise FakeJobFailureError(f"Job {self._job_id} failed (injected).")
+            if time.time() >= deadline:
+                raise TimeoutError(f"Timed out waiting for job {self._job_id}.")
+            time.sleep(POLL_INTERVAL)
+
+class FakeBackend:
+    def __init__(self, service, name):
+        self.service = service
+        self.name = name
+
+_replay_cache = {}
+_replay_lock = threading.Lock()
+
+def load_replay(replay_dir):
+    """Indexes every job found in results files under replay_dir: job id -> counts."""
+    replay_dir = os.path.abspath(replay_dir)
+    with _replay_lock:
+        if replay_dir in _replay_cache:
+            return _replay_cache[replay_dir]
+
+        jobs = {}
+        for root, _, files in os.walk(replay_dir):
+            for fname in sorted(files):
+                if not (fname.startswith("results") and fname.endswith(".json")):
+                    continue
+                try:
+                    with open(os.path.join(root, fname), "r") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                for key, job in data.items():
+                    if key.startswith("job_") and isinstance(job, dict) and job.get("id") and job.get("counts"):
+                        jobs[job["id"]] = job["counts"]
+        _replay_cache[replay_dir] = jobs
+        return jobs
+
+class FakeRuntimeService:
+    """Drop-in for QiskitRuntimeService. Jobs stored under replay_dir are returned
+    as DONE with their recorded counts; new submissions synthesize counts from a
+    binomial around p0 values drawn from the replayed jobs (or default_p0).
+
+    Submitted jobs are appended to a JSON-lines state file (state_path, else
+    QTORSION_FAKE_STATE, else fake_runtime_state.jsonl in the working directory)
+    so a later or concurrent process fetching them sees the same counts, status
+    and injected failure. Ids with the fake prefix that are in neither the state
+    file nor this process raise FakeJobNotFoundError; only foreign ids missing
+    from the replay data get synthesized counts. persist=False keeps jobs in
+    memory only."""
+
+    def __init__(self, channel=None, token=None, instance=None, replay_dir=None,
+                 queue_latency=None, run_time=None, failure_rate=None, timeout_rate=None,
+                 default_p0=DEFAULT_P0, result_timeout=RESULT_TIMEOUT,
+                 synthesize_unknown=True, seed=None, state_path=None, persist=True):
+        self.queue_latency = env_value("QTORSION_FAKE_QUEUE_LATENCY", QUEUE_LATENCY) if queue_latency is None else queue_latency
+        self.run_time = env_value("QTORSION_FAKE_RUN_TIME", RUN_TIME) if run_time is None else run_time
+        self.failure_rate = env_value("QTORSION_FAKE_FAILURE_RATE", FAILURE_RATE) if failure_rate is None else failure_rate
+        self.timeout_rate = env_value("QTORSION_FAKE_TIMEOUT_RATE", TIMEOUT_RATE) if timeout_rate is None else timeout_rate
+        seed = env_value("QTORSION_FAKE_SEED", None, int) if seed is None else seed
+        self.result_timeout = result_timeout
+        self.synthesize_unknown = synthesize_unknown
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._jobs = {}
+        replay_dir = replay_dir or os.environ.get("QTORSION_FAKE_REPLAY")
+        self._replay = load_replay(replay_dir) if replay_dir else {}
+
+        self.state_path = None
+        self._state_offset = 0
+        if persist:
+            self.state_path = state_path or os.environ.get("QTORSION_FAKE_STATE") or STATE_NAME
+
+        p0_pool = []
+        for counts in self._replay.values():
+            shots = sum(counts.values())
+            if shots > 0:
+                p0_pool.append(counts.get("0", 0) / shots)
+        self._p0_pool = p0_pool or [default_p0]
+
+    def backend(self, name=None, instance=None):
+        # Prefer a real qiskit target so transpile() works; fall back to a bare handle
+        try:
+            from qiskit.providers.fake_provider import GenericBackendV2
+        except ImportError:
+            return FakeBackend(self, name or "fake_backend")
+        backend = GenericBackendV2(num_qubits=2, seed=42)
+        backend.name = name or "fake_backend"
+        backend.service = self
+        return backend
+
+    def _synthesize_counts(self, shots, rng):
+        p0 = rng.choice(self._p0_pool)
+        zeros = np.random.default_rng(rng.getrandbits(32)).binomial(shots, p0)
+        return {"0": int(zeros), "1": int(shots - zeros)}
+
+    def _draw_fate(self):
+        roll = self._rng.random()
+        if roll < self.failure_rate:
+            return "ERROR"
+        if roll < self.failure_rate + self.timeout_rate:
+            return "TIMEOUT"
+        return "DONE"
+
+    def _refresh_state(self):
+        """Reads records appended to the state file since the last refresh."""
+        try:
+            with open(self.state_path, "rb") as f:
+                f.seek(self._state_offset)
+                chunk = f.read()
+        except OSError:
+            return
+        # A record still being written has no trailing newline yet
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            job_id = record.pop("job_id")
+            self._jobs.setdefault(job_id, FakeJob.from_state(self, job_id, record))
+        self._state_offset += end
+
+    def _save_job(self, job):
+        # One append-mode write per record, so concurrent submitters never
+        # overwrite each other and each submit costs O(1)
+        line = json.dumps(dict(job.to_state(), job_id=job.job_id())) + "\n"
+        fd = os.open(self.state_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+    def submit(self, pub_shots):
+        with self._lock:
+            job_id = JOB_PREFIX + uuid.uuid4().hex[:16]
+            latency = self._rng.expovariate(1 / self.queue_latency) if self.queue_latency > 0 else 0.0
+            fate = self._draw_fate()
+            pub_counts = [self._synthesize_counts(shots, self._rng) for shots in pub_shots]
+            queued_until = time.time() + latency
+            job = FakeJob(self, job_id, pub_counts, queued_until, queued_until + self.run_time, fate)
+            self._jobs[job_id] = job
+            if self.state_path:
+                self._save_job(job)
+        return job
+
+    def job(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None and self.state_path:
+                self._refresh_state()
+                job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+
+        if job_id in self._replay:
+            pub_counts = [self._replay[job_id]]
+        elif job_id.startswith(JOB_PREFIX):
+            raise FakeJobNotFoundError(f"Job {job_id} not found.")
+        elif self.synthesize_unknown:
+            # Seeded by the id so separate processes agree on the counts
+            rng = random.Random(hashlib.md5(job_id.encode()).hexdigest())
+            pub_counts = [self._synthesize_counts(DEFAULT_SHOTS, rng)]
+        else:
+            raise FakeJobNotFoundError(f"Job {job_id} not found.")
+
+        job = FakeJob(self, job_id, pub_counts, -math.inf, -math.inf, "DONE")
+        with self._lock:
+            self._jobs.setdefault(job_id, job)
+        return job
+
+class FakeSamplerV2:
+    """Drop-in for SamplerV2; pubs are a circuit or a (circuit, params, shots) tuple."""
+
+    def __init__(self, mode=None, options=None):
+        self.service = getattr(mode, "service", None) or FakeRuntimeService()
+
+    def run(self, pubs, shots=None):
+        default = shots or DEFAULT_SHOTS
+        pub_shots = []
+        for pub in pubs:
+            if isinstance(pub, tuple) and len(pub) > 2 and pub[2] is not None:
+                pub_shots.append(pub[2])
+            else:
+                pub_shots.append(default)
+        return self.service.submit(pub_shots)
@@ -1,19 +1,25 @@
+import os
 import sys
 import math
 import json
 import numpy as np
-from qiskit_ibm_runtime import QiskitRuntimeService
 from datetime import datetime
 
+if os.environ.get("QTORSION_FAKE_RUNTIME"):
+    from fake_runtime import FakeRuntimeService as QiskitRuntimeService
+else:
+    from qiskit_ibm_runtime import QiskitRuntimeService
+
 def timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 def timestamp_for_filename():
     return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
-def get_result(job_id):
+def get_result(job_id, service=None):
     print("[" + timestamp() + "] Getting job " + job_id)
-    service = QiskitRuntimeService()
+    if service is None:
+        service = QiskitRuntimeService()
     job = service.job(job_id)
 
     if job.status() != "DONE":
@@ -0,0 +1,111 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Route get_results through the offline service before it is imported
+os.environ.setdefault("QTORSION_FAKE_RUNTIME", "1")
+
+from fake_runtime import FakeRuntimeService, FakeSamplerV2
+from get_results import get_result
+
+# Constants (configurable)
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+BACKEND_NAME = "ibm_torino"
+SHOTS = 10000
+QUEUE_LATENCY = 0.05
+RUN_TIME = 0.01
+FAILURE_RATE = 0.01
+TIMEOUT_RATE = 0.005
+RESULT_TIMEOUT = 2.0
+POLL_INTERVAL = 0.01
+
+def timestamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def fetch(service, job_id):
+    """Polls a job like a retrieval loop would and returns its outcome."""
+    deadline = time.monotonic() + RESULT_TIMEOUT
+    while True:
+        status = service.job(job_id).status()
+        if status == "DONE":
+            return "done" if get_result(job_id, service) else "missing"
+        if status in ("ERROR", "CANCELLED"):
+            return "failed"
+        if time.monotonic() >= deadline:
+            return "timed_out"
+        time.sleep(POLL_INTERVAL)
+
+def run_load_test(num_jobs, concurrency):
+    # Submitter and fetcher are separate services sharing one state file, so the
+    # fetch side goes through the same persisted path as get_results.py would
+    state_path = os.path.join(tempfile.gettempdir(), f"qtorsion_load_test_{os.getpid()}.jsonl")
+    submit_service = FakeRuntimeService(replay_dir=REPLAY_DIR, queue_latency=QUEUE_LATENCY, run_time=RUN_TIME,
+                                        failure_rate=FAILURE_RATE, timeout_rate=TIMEOUT_RATE,
+                                        result_timeout=RESULT_TIMEOUT, state_path=state_path)
+    fetch_service = FakeRuntimeService(replay_dir=REPLAY_DIR, result_timeout=RESULT_TIMEOUT, state_path=state_path)
+    sampler = FakeSamplerV2(submit_service.backend(name=BACKEND_NAME))
+
+    def run_job(i):
+        # Each worker submits and then polls its own job, so latency is end to end
+        start = time.monotonic()
+        # The fake sampler only reads per-pub shots, so labels stand in for circuits
+        job_id = sampler.run(["AB"[i % 2]], shots=SHOTS).job_id()
+        submitted = time.monotonic()
+        outcome = fetch(fetch_service, job_id)
+        return outcome, submitted - start, time.monotonic() - start
+
+    print(f"[{timestamp()}] Running {num_jobs} jobs with {concurrency} workers...")
+    start = time.monotonic()
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                runs = list(pool.map(run_job, range(num_jobs)))
+    finally:
+        if os.path.exists(state_path):
+            os.remove(state_path)
+    seconds = time.monotonic() - start
+
+    outcomes = {}
+    for outcome, _, _ in runs:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    submit_latencies = [submit for _, submit, _ in runs]
+    latencies = [total for outcome, _, total in runs if outcome == "done"]
+
+    result = {
+        "timestamp": timestamp(),
+        "jobs": num_jobs,
+        "concurrency": concurrency,
+        "shots": SHOTS,
+        "queue_latency": QUEUE_LATENCY,
+        "seconds": round(seconds, 3),
+        "throughput": round(num_jobs / seconds, 1) if seconds > 0 else None,
+        "outcomes": outcomes,
+        "submit_latency": {
+            "p50": round(percentile(submit_latencies, 0.5), 4),
+            "p95": round(percentile(submit_latencies, 0.95), 4)
+        },
+        "latency": {
+            "p50": round(percentile(latencies, 0.5), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0
+        }
+    }
+    print(json.dumps(result, indent=2))
+    return result
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python load_test.py <num_jobs> [concurrency]")
+        sys.exit(1)
+    run_load_test(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) == 3 else 8)
@@ -1,10 +1,15 @@
+import os
 import hashlib
 import json
 import numpy as np
 from datetime import datetime
 from qiskit import QuantumCircuit, transpile
 from qiskit.qasm3 import dumps as qasm3_dumps, loads as qasm3_loads
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
+
+if os.environ.get("QTORSION_FAKE_RUNTIME"):
+    from fake_runtime import FakeRuntimeService as QiskitRuntimeService, FakeSamplerV2 as SamplerV2
+else:
+    from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
 
 def timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
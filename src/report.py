@@ -0,0 +1,304 @@
+import os
+import sys
+import json
+import math
+import hashlib
+from datetime import datetime
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+CACHE_NAME = "report_cache.json"
+# Figure digests cover only the plotted data: bump CACHE_VERSION after changing
+# titles, bins or styling so every figure is re-rendered
+CACHE_VERSION = 1
+MAX_POINTS = 2000
+Z_THRESHOLD = 2.0
+
+def timestamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def compute_z(p0a, sigmaa, p0b, sigmab):
+    delta = abs(p0a - p0b)
+    sigma_total = math.sqrt(sigmaa**2 + sigmab**2)
+    z = delta / sigma_total if sigma_total > 0 else float("inf")
+    return z
+
+# Per-file summaries
+def summarize_results(data):
+    """Reduces one results file (Setup AB or ABC) to the values the figures need."""
+    a, b = data["job_a"], data["job_b"]
+    z_ab = compute_z(a["p_0"], a["sigma"], b["p_0"], b["sigma"])
+    summary = {
+        "timestamp": data.get("timestamp", ""),
+        "job_ids": [a.get("id", ""), b.get("id", "")],
+        "z": z_ab,
+        "z_eff": None
+    }
+    if "job_c" in data:
+        c = data["job_c"]
+        z_ac = compute_z(a["p_0"], a["sigma"], c["p_0"], c["sigma"])
+        summary["job_ids"].append(c.get("id", ""))
+        summary["z_eff"] = z_ab / (z_ac + 1e-9)
+    if data.get("mode") == "interleaved":
+        # Use the drift-corrected paired-segment values from analyze_interleaved.py
+        summary["job_ids"].append(data["job_id"])
+        summary["z"] = float(data["z_ab"])
+        summary["z_eff"] = float(data["z_eff"])
+    return summary
+
+def summarize_meta(data):
+    """Reduces one submit file to its job id -> backend mapping."""
+    backend = data.get("backend", "unknown")
+    mapping = {job["job_id"]: backend for job in data.get("jobs", [])}
+    if "job_id" in data:
+        mapping[data["job_id"]] = backend
+    return mapping
+
+def load_cache(path):
+    try:
+        with open(path, "r") as f:
+            cache = json.load(f)
+        if cache.get("version") == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"version": CACHE_VERSION, "files": {}, "figures": {}}
+
+def scan_folder(folder_path, summarize, cache_files, seen):
+    """Returns summaries for every JSON file in folder_path, re-parsing only files
+    whose size or mtime differ from the cached entry. Returns (summaries, parsed, cached)."""
+    summaries = []
+    parsed = 0
+    cached_hits = 0
+    if not os.path.isdir(folder_path):
+        return summaries, parsed, cached_hits
+
+    entries = sorted((e for e in os.scandir(folder_path) if e.name.endswith(".json")), key=lambda e: e.name)
+    for entry in entries:
+        st = entry.stat()
+        key = os.path.abspath(entry.path)
+        seen.add(key)
+        cached = cache_files.get(key)
+        if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            summaries.append((entry.name, cached["summary"]))
+            cached_hits += 1
+            continue
+
+        try:
+            with open(entry.path, "r") as f:
+                summary = summarize(json.load(f))
+        except Exception as e:
+            print(f"Error reading {entry.name}: {e}", file=sys.stderr)
+            continue
+
+        cache_files[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "summary": summary}
+        summaries.append((entry.name, summary))
+        parsed += 1
+    return summaries, parsed, cached_hits
+
+# Rendering
+def downsample_minmax(y, max_points=MAX_POINTS):
+    """Returns indices into y that keep the min and max of each bucket, so spikes
+    survive rendering when the series is longer than max_points."""
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    n_buckets = max_points // 2
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+    idx = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        seg = y[lo:hi]
+        idx.append(lo + int(np.argmin(seg)))
+        idx.append(lo + int(np.argmax(seg)))
+    return np.unique(idx)
+
+def finite(values):
+    arr = np.asarray(values, dtype=float)
+    return arr[np.isfinite(arr)]
+
+def plot_histogram(path, values, title, xlabel="Z-value", log=False):
+    values = finite(values)
+    if log:
+        values = values[values > 0]
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bins = 20
+    if log and len(values):
+        bins = np.logspace(np.log10(values.min()), np.log10(values.max()) + 1e-9, 21)
+        ax.set_xscale("log")
+    ax.hist(values, bins=bins, color="skyblue", edgecolor="black")
+    ax.axvline(Z_THRESHOLD, color="red", linestyle="--", linewidth=2, label=f"Z = {Z_THRESHOLD:g} threshold")
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Number of experiments")
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path, dpi=200)
+    plt.close(fig)
+
+def plot_over_time(path, values, title, log=False):
+    y = np.asarray(values, dtype=float)
+    y = np.where(np.isfinite(y), y, np.nan)
+    idx = downsample_minmax(np.nan_to_num(y, nan=0.0))
+    x = idx + 1
+    fig, ax = plt.subplots(figsize=(12, 6))
+    marker = "o" if len(idx) <= 200 else None
+    ax.plot(x, y[idx], color="#1f5f7f", linewidth=2, marker=marker)
+    if log:
+        ax.set_yscale("log")
+    ax.set_title(title, fontsize=14)
+    ax.set_xlabel("Run")
+    ax.grid(True, axis="y", alpha=0.7)
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+def plot_boxplot(path, groups, title, xlabel):
+    labels = [label for label, _ in groups]
+    data = [finite(values) for _, values in groups]
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.boxplot(data, tick_labels=labels,
+               boxprops={"color": "orange"}, whiskerprops={"color": "orange"},
+               medianprops={"color": "red"})
+    ax.set_title(title, fontsize=14)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Z-value")
+    ax.grid(True, linestyle="--", alpha=0.7)
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+def quartile_groups(values):
+    """Splits z-values into low / medium-low / medium-high / high quartile groups."""
+    values = finite(values)
+    if not len(values):
+        return []
+    q1, q2, q3 = np.percentile(values, [25, 50, 75])
+    return [
+        ("low", values[values <= q1]),
+        ("medium-low", values[(values > q1) & (values <= q2)]),
+        ("medium-high", values[(values > q2) & (values <= q3)]),
+        ("high", values[values > q3])
+    ]
+
+def safe_name(name):
+    return "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+
+def build_figures(runs, suffix=""):
+    """Returns {filename: (render, data)} for every figure the runs of one setup
+    support; suffix (e.g. "_Setup_ABC") is appended to every filename."""
+    figures = {}
+    z = [r["z"] for r in runs]
+    if z:
+        figures[f"z_histogram{suffix}.png"] = (lambda p, d: plot_histogram(p, d, "Distribution of Z-values"), z)
+        figures[f"zvalues_over_time{suffix}.png"] = (lambda p, d: plot_over_time(p, d, "z_value"), z)
+        figures[f"z_value_boxplot{suffix}.png"] = (
+            lambda p, d: plot_boxplot(p, quartile_groups(d), "Boxplot of Z-values by Group", "Group"), z)
+
+    # Per-backend figures only when they split the setup: runs without a meta
+    # file ("unknown") are left out, and a single backend would repeat the above
+    by_backend = {}
+    for r in runs:
+        if r["backend"] != "unknown":
+            by_backend.setdefault(r["backend"], []).append(r["z"])
+    if len(by_backend) < 2:
+        by_backend = {}
+    if by_backend:
+        groups = sorted(by_backend.items())
+        figures[f"z_value_boxplot_by_backend{suffix}.png"] = (
+            lambda p, d: plot_boxplot(p, d, "Boxplot of Z-values by Backend", "Backend"), groups)
+    for backend, values in by_backend.items():
+        name = safe_name(backend)
+        figures[f"z_histogram{suffix}_{name}.png"] = (
+            lambda p, d, b=backend: plot_histogram(p, d, f"Distribution of Z-values ({b})"), values)
+        figures[f"zvalues_over_time{suffix}_{name}.png"] = (
+            lambda p, d, b=backend: plot_over_time(p, d, f"z_value ({b})"), values)
+
+    z_eff = [r["z_eff"] for r in runs if r["z_eff"] is not None]
+    if z_eff:
+        figures[f"z_eff_histogram{suffix}.png"] = (
+            lambda p, d: plot_histogram(p, d, "Distribution of z_eff (ABC)", xlabel="z_eff", log=True), z_eff)
+        figures[f"z_eff_over_time{suffix}.png"] = (lambda p, d: plot_over_time(p, d, "z_eff (ABC)", log=True), z_eff)
+    return figures
+
+def digest(data):
+    payload = json.dumps(data, sort_keys=True)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+def main(output_dir, folders):
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_NAME)
+    cache = load_cache(cache_path)
+    cache_files = cache["files"]
+    seen = set()
+    parsed_total = 0
+    cached_total = 0
+
+    # Runs are grouped by setup (the parent folder, e.g. Setup_AB); backends come
+    # from the sibling meta/ folder of each results folder
+    backends = {}
+    runs = []
+    setups = []
+    for folder in folders:
+        setup_dir = os.path.dirname(os.path.abspath(folder))
+        setup = os.path.basename(setup_dir)
+        if setup not in setups:
+            setups.append(setup)
+
+        metas, parsed, cached = scan_folder(os.path.join(setup_dir, "meta"), summarize_meta, cache_files, seen)
+        parsed_total += parsed
+        cached_total += cached
+        for _, mapping in metas:
+            backends.update(mapping)
+
+        results, parsed, cached = scan_folder(folder, summarize_results, cache_files, seen)
+        parsed_total += parsed
+        cached_total += cached
+        for fname, summary in results:
+            runs.append(dict(summary, file=fname, setup=setup))
+
+    for key in set(cache_files) - seen:
+        del cache_files[key]
+
+    runs.sort(key=lambda r: (r["timestamp"], r["file"]))
+    for r in runs:
+        r["backend"] = next((backends[j] for j in r["job_ids"] if j in backends), "unknown")
+
+    print(f"[{timestamp()}] {len(runs)} runs, {parsed_total} files parsed, {cached_total} from cache")
+
+    # The first setup gets the canonical filenames (images/z_histogram.png, ...)
+    figures = {}
+    for i, setup in enumerate(setups):
+        suffix = "" if i == 0 else f"_{safe_name(setup)}"
+        figures.update(build_figures([r for r in runs if r["setup"] == setup], suffix))
+
+    for name in set(cache["figures"]) - set(figures):
+        del cache["figures"][name]
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"[{timestamp()}] Removed stale {path}")
+    rendered = 0
+    for name, (render, data) in sorted(figures.items()):
+        path = os.path.join(output_dir, name)
+        key = digest(data)
+        if cache["figures"].get(name) == key and os.path.exists(path):
+            continue
+        render(path, data)
+        cache["figures"][name] = key
+        rendered += 1
+        print(f"[{timestamp()}] Rendered {path}")
+
+    with open(cache_path, "w") as f:
+        json.dump(cache, f)
+    print(f"[{timestamp()}] {rendered} of {len(figures)} figures re-rendered")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python report.py <output_dir> <canonical_results_folder> [<results_folder> ...]")
+        sys.exit(1)
+
+    main(sys.argv[1], sys.argv[2:])